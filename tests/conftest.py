@@ -23,24 +23,43 @@ def tmp_path_2(tmp_path, request) -> pathlib.Path:
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def dvc_scaffold(tmp_path_factory) -> pathlib.Path:
+    """Initialized GIT and DVC repository, created once per session.
+
+    Copying this directory is cheaper than running 'git init' and
+    'dvc init' for every test.
+    """
+    path = tmp_path_factory.mktemp("dvc_scaffold")
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        git.Repo.init()
+        dvc.cli.main(["init"])
+    finally:
+        os.chdir(cwd)
+
+    return path
+
+
 @pytest.fixture
-def proj_path(tmp_path, request) -> pathlib.Path:
+def proj_path(tmp_path, request, dvc_scaffold) -> pathlib.Path:
     """Temporary directory for testing DVC calls
 
     Parameters
     ----------
     tmp_path
     request: https://docs.pytest.org/en/6.2.x/reference.html#std-fixture-request
+    dvc_scaffold: initialized GIT and DVC repository to copy from
 
     Returns
     -------
     path to temporary directory
 
     """
+    shutil.copytree(dvc_scaffold, tmp_path, dirs_exist_ok=True)
     shutil.copy(request.module.__file__, tmp_path)
     os.chdir(tmp_path)
-    git.Repo.init()
-    dvc.cli.main(["init"])
 
     return tmp_path
 
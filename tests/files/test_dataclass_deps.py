@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import json
 import pathlib
 
@@ -6,9 +7,20 @@ import yaml
 
 import zntrack
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 CWD = pathlib.Path(__file__).parent.resolve()
 
 
+@functools.lru_cache(maxsize=None)
+def _load_json(path: pathlib.Path) -> dict:
+    with path.open("rb") as f:
+        return json.load(f)
+
+
 @dataclasses.dataclass
 class SimpleThermostat:
     """Simple thermostat class"""
@@ -84,12 +96,12 @@ def test_deps_outside_graph(proj_path):
     assert node2.thermostat[1].temp == ml.temp
     assert node2.thermostat[2].temperature == t2.temperature
 
-    assert json.loads(
-        (CWD / "zntrack_config" / "dataclass_deps.json").read_text()
-    ) == json.loads((proj_path / "zntrack.json").read_text())
-    assert yaml.safe_load(
-        (CWD / "dvc_config" / "dataclass_deps.yaml").read_text()
-    ) == yaml.safe_load((proj_path / "dvc.yaml").read_text())
+    with (proj_path / "zntrack.json").open("rb") as f:
+        assert _load_json(CWD / "zntrack_config" / "dataclass_deps.json") == json.load(f)
+    with (proj_path / "dvc.yaml").open("rb") as f:
+        assert _load_json(CWD / "dvc_config" / "dataclass_deps.json") == yaml.load(
+            f, Loader=SafeLoader
+        )
     assert (CWD / "params_config" / "dataclass_deps.yaml").read_text() == (
         proj_path / "params.yaml"
     ).read_text()
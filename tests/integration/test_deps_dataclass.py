@@ -18,6 +18,11 @@ class ThermostatB:
     temperature: float = zntrack.params()
 
 
+@dataclasses.dataclass
+class ListConfig:
+    values: list
+
+
 class MD(zntrack.Node):
     thermostat: ThermostatA | ThermostatB | SimpleThermostat = zntrack.deps()
 
@@ -54,5 +59,27 @@ def test_switch_deps_class_keep_params(proj_path):
     assert md.from_rev().result == "SimpleThermostat"
 
 
+class ListConfigNode(zntrack.Node):
+    cfg: ListConfig = zntrack.deps()
+
+    def run(self):
+        pass
+
+
+def test_deps_dataclass_is_copied(proj_path):
+    """Modifying a loaded dataclass must not affect other loaded nodes."""
+    proj = zntrack.Project()
+
+    with proj:
+        ListConfigNode(cfg=ListConfig(values=[1, 2]))
+
+    proj.build()
+
+    node = ListConfigNode.from_rev()
+    node.cfg.values.append(99)
+
+    assert ListConfigNode.from_rev().cfg.values == [1, 2]
+
+
 if __name__ == "__main__":
     test_switch_deps_class_keep_params("")
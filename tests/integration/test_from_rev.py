@@ -1,9 +1,12 @@
+import pathlib
 import uuid
 
 import dvc.scm
 import pytest
+import yaml
 
 import zntrack.examples
+from zntrack.from_rev import _get_stage_cmds
 
 # from zntrack.utils import NodeStatusResults
 
@@ -129,3 +132,28 @@ def test_two_nodes_connect_external(proj_path):
 
     assert node1.outs == node_a.outs + 1
     assert node2.outs == node_a.outs + 1
+
+
+def test_from_rev_dvc_yaml_changed(proj_path):
+    """The cached stage lookup must follow changes to 'dvc.yaml'."""
+    with zntrack.Project() as project:
+        a = zntrack.examples.ParamsToOuts(params=1)
+        b = zntrack.examples.ParamsToOuts(params=2)
+
+    project.build()
+
+    dvc_yaml = pathlib.Path("dvc.yaml")
+    content = dvc_yaml.read_text()
+    config = yaml.safe_load(content)
+    del config["stages"][b.name]
+    dvc_yaml.write_text(yaml.safe_dump(config))
+
+    assert zntrack.from_rev(a.name).params == 1
+    with pytest.raises(ValueError):
+        zntrack.from_rev(b.name)
+    # the miss must not clear the other cached entries
+    assert _get_stage_cmds.cache_info().currsize == 1
+
+    # add the stage again, after the lookup has been cached
+    dvc_yaml.write_text(content)
+    assert zntrack.from_rev(b.name).params == 2
@@ -1,7 +1,9 @@
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 import zntrack
+import zntrack.node
 
 
 class MetricsNode(zntrack.Node):
@@ -36,3 +38,52 @@ def test_simple_metrics(proj_path):
     assert isinstance(node.metrics, dict)
     assert node.metrics["n"] == 10
     assert len(node.metrics) == 1
+
+
+class MetricsAndOutsNode(zntrack.Node):
+    n: int = zntrack.params()
+
+    outs: list = zntrack.outs()
+    metrics: dict = zntrack.metrics()
+
+    def run(self):
+        self.outs = list(range(self.n))
+        self.metrics = {"n": self.n}
+
+
+def _save_and_read(node: MetricsAndOutsNode) -> dict[str, str]:
+    files = {name: (node.nwd / name).with_suffix(".json") for name in ["outs", "metrics"]}
+    for path in files.values():
+        path.unlink(missing_ok=True)
+    node.save()
+    return {name: path.read_text() for name, path in files.items()}
+
+
+def test_parallel_io(proj_path, monkeypatch):
+    executors = []
+
+    def spy_executor(*args, **kwargs):
+        executor = ThreadPoolExecutor(*args, **kwargs)
+        executors.append(executor)
+        return executor
+
+    monkeypatch.setattr(zntrack.node, "ThreadPoolExecutor", spy_executor)
+
+    with zntrack.Project() as proj:
+        node = MetricsAndOutsNode(n=10)
+
+    proj.build()
+    node.run()
+
+    monkeypatch.setenv("ZNTRACK_PARALLEL_IO", "0")
+    serial = _save_and_read(node)
+    assert executors == []
+
+    monkeypatch.setenv("ZNTRACK_PARALLEL_IO", "1")
+    parallel = _save_and_read(node)
+    assert len(executors) == 1
+
+    assert parallel == serial
+    node = node.from_rev()
+    assert node.outs == list(range(10))
+    assert node.metrics == {"n": 10}
@@ -1,6 +1,8 @@
+import collections
+import contextlib
 import dataclasses
-import os
 import pathlib
+import shutil
 import uuid
 
 import git
@@ -12,6 +14,11 @@ from mlflow.utils import mlflow_tags
 
 import zntrack.examples
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 
 @dataclasses.dataclass
 class T1:
@@ -57,31 +64,50 @@ class RangePlotter(zntrack.Node):
         self.plots = pd.DataFrame({"idx": [idx for idx in range(self.start, self.stop)]})
 
 
-@pytest.fixture
-def mlflow_proj_path(proj_path):
-    os.environ["ZNTRACK_PLUGINS"] = (
-        "zntrack.plugins.dvc_plugin.DVCPlugin,zntrack.plugins.mlflow_plugin.MLFlowPlugin"
-    )
-    os.environ["MLFLOW_TRACKING_URI"] = "http://127.0.0.1:5000"
-    os.environ["MLFLOW_EXPERIMENT_NAME"] = f"test-{uuid.uuid4()}"
-
-    config = {
-        "global": {
-            "ZNTRACK_PLUGINS": os.environ["ZNTRACK_PLUGINS"],
-            "MLFLOW_TRACKING_URI": os.environ["MLFLOW_TRACKING_URI"],
-            "MLFLOW_EXPERIMENT_NAME": os.environ["MLFLOW_EXPERIMENT_NAME"],
-        }
+@pytest.fixture(scope="module")
+def mlflow_env():
+    """Set the MLflow environment once for all tests in this module."""
+    env = {
+        "ZNTRACK_PLUGINS": (
+            "zntrack.plugins.dvc_plugin.DVCPlugin,"
+            "zntrack.plugins.mlflow_plugin.MLFlowPlugin"
+        ),
+        "MLFLOW_TRACKING_URI": "http://127.0.0.1:5000",
     }
-    pathlib.Path("env.yaml").write_text(yaml.dump(config))
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        yield env
+
+
+@contextlib.contextmanager
+def mlflow_experiment(env: dict):
+    """Use a fresh MLflow experiment and write its config to 'env.yaml'.
 
-    yield proj_path
+    Runs are reused by stage hash, so every test needs its own
+    experiment to not pick up the runs of another test.
+    """
+    env = {**env, "MLFLOW_EXPERIMENT_NAME": f"test-{uuid.uuid4()}"}
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("MLFLOW_EXPERIMENT_NAME", env["MLFLOW_EXPERIMENT_NAME"])
+        config = {"global": env}
+        pathlib.Path("env.yaml").write_text(yaml.dump(config, Dumper=SafeDumper))
+        yield
 
-    del os.environ["ZNTRACK_PLUGINS"]
-    del os.environ["MLFLOW_TRACKING_URI"]
-    del os.environ["MLFLOW_EXPERIMENT_NAME"]
+
+@pytest.fixture
+def mlflow_proj_path(proj_path, mlflow_env):
+    with mlflow_experiment(mlflow_env):
+        yield proj_path
+
+
+@pytest.fixture
+def git_repo(mlflow_proj_path) -> git.Repo:
+    return git.Repo()
 
 
-def test_mlflow_metrics(mlflow_proj_path):
+def test_mlflow_metrics(mlflow_proj_path, git_repo):
+    client = mlflow.MlflowClient()
     proj = zntrack.Project()
 
     with proj:
@@ -102,7 +128,7 @@ def test_mlflow_metrics(mlflow_proj_path):
     assert child_run_id is not None
     assert parent_run_id is not None
 
-    run = mlflow.get_run(child_run_id)
+    run = client.get_run(child_run_id)
     # assert params are logged
     assert run.data.params == {"params": "{'loss': 0}"}  # this is strange!
     # assert tags
@@ -115,15 +141,16 @@ def test_mlflow_metrics(mlflow_proj_path):
 
     # make a git commit with all the changes
     proj.finalize(msg="test")
-    repo = git.Repo()
+    sha = git_repo.head.commit.hexsha
 
-    run = mlflow.get_run(child_run_id)  # need to query the run again
+    run = client.get_run(child_run_id)  # need to query the run again
 
     assert run.data.tags["git_commit_message"] == "test"
-    assert run.data.tags["git_commit_hash"] == repo.head.commit.hexsha
+    assert run.data.tags["git_commit_hash"] == sha
 
 
-def test_mlflow_plotting(mlflow_proj_path):
+def test_mlflow_plotting(mlflow_proj_path, git_repo):
+    client = mlflow.MlflowClient()
     proj = zntrack.Project()
 
     with proj:
@@ -141,7 +168,7 @@ def test_mlflow_plotting(mlflow_proj_path):
     assert child_run_id is not None
     assert parent_run_id is not None
 
-    run = mlflow.get_run(child_run_id)
+    run = client.get_run(child_run_id)
     # assert params are logged
     assert run.data.params == {"start": "0", "stop": "10"}
     # assert tags
@@ -152,74 +179,112 @@ def test_mlflow_plotting(mlflow_proj_path):
     # assert metrics (last)
     assert run.data.metrics == {"plots.idx": 9.0}
 
-    client = mlflow.MlflowClient()
     history = client.get_metric_history(child_run_id, "plots.idx")
     assert len(history) == 10
     assert [entry.value for entry in history] == list(range(10))
 
     # make a git commit with all the changes
-    repo = git.Repo()
-    repo.git.add(".")
-    repo.git.commit("-m", "test")
+    changed = git_repo.untracked_files + [d.a_path for d in git_repo.index.diff(None)]
+    git_repo.index.add(changed)
+    git_repo.index.commit("test")
+    sha = git_repo.head.commit.hexsha
     node.state.plugins["MLFlowPlugin"].finalize()
 
-    run = mlflow.get_run(child_run_id)  # need to query the run again
+    run = client.get_run(child_run_id)  # need to query the run again
 
     assert run.data.tags["git_commit_message"] == "test"
-    assert run.data.tags["git_commit_hash"] == repo.head.commit.hexsha
+    assert run.data.tags["git_commit_hash"] == sha
 
 
-@pytest.mark.parametrize("skip_cached", [True, False])
-def test_multiple_nodes(mlflow_proj_path, skip_cached):
-    with zntrack.Project() as proj:
-        a = zntrack.examples.ParamsToOuts(params=3)
-        b = zntrack.examples.ParamsToOuts(params=7)
-        c = zntrack.examples.SumNodeAttributesToMetrics(inputs=[a.outs, b.outs], shift=0)
-
-    proj.repro()
+@pytest.fixture(scope="module", params=[True, False], ids=["skip_cached", "all"])
+def multiple_nodes(mlflow_env, dvc_scaffold, tmp_path_factory, request) -> dict:
+    """Run and finalize two experiments of a three node graph.
 
-    assert c.metrics == {"value": 10.0}
-
-    with a.state.plugins["MLFlowPlugin"]:
-        a_run = mlflow.get_run(a.state.plugins["MLFlowPlugin"].child_run_id)
-
-    with b.state.plugins["MLFlowPlugin"]:
-        b_run = mlflow.get_run(b.state.plugins["MLFlowPlugin"].child_run_id)
-
-    with c.state.plugins["MLFlowPlugin"]:
-        c_run = mlflow.get_run(c.state.plugins["MLFlowPlugin"].child_run_id)
-
-    assert c_run.data.metrics == {"metrics.value": 10.0}
-
-    proj.finalize(msg="exp1", skip_cached=skip_cached, update_run_names=not skip_cached)
-    repo = git.Repo()
-
-    a.params = 5
-    proj.repro()
+    The graph is only executed once per 'skip_cached' value
+    and shared between the first and second run tests.
+    """
+    skip_cached = request.param
+    client = mlflow.MlflowClient()
 
-    proj.finalize(msg="exp2", skip_cached=skip_cached, update_run_names=not skip_cached)
-    repo = git.Repo()
+    path = tmp_path_factory.mktemp("multiple_nodes")
+    shutil.copytree(dvc_scaffold, path, dirs_exist_ok=True)
+
+    # restore the cwd once the module is done
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(path)
+        repo = git.Repo()
+        with mlflow_experiment(mlflow_env):
+            with zntrack.Project() as proj:
+                a = zntrack.examples.ParamsToOuts(params=3)
+                b = zntrack.examples.ParamsToOuts(params=7)
+                c = zntrack.examples.SumNodeAttributesToMetrics(
+                    inputs=[a.outs, b.outs], shift=0
+                )
+
+            proj.repro()
+            c_metrics = c.metrics
+
+            with b.state.plugins["MLFlowPlugin"]:
+                b_run = client.get_run(b.state.plugins["MLFlowPlugin"].child_run_id)
+
+            with c.state.plugins["MLFlowPlugin"]:
+                c_run = client.get_run(c.state.plugins["MLFlowPlugin"].child_run_id)
+
+            proj.finalize(
+                msg="exp1", skip_cached=skip_cached, update_run_names=not skip_cached
+            )
+
+            a.params = 5
+            proj.repro()
+
+            proj.finalize(
+                msg="exp2", skip_cached=skip_cached, update_run_names=not skip_cached
+            )
+
+            yield {
+                "skip_cached": skip_cached,
+                "nodes": (a, b, c),
+                "c_metrics": c_metrics,
+                "b_run": b_run,
+                "c_run": c_run,
+                "sha": repo.head.commit.hexsha,
+            }
+
+
+# tests sharing the module-scoped graph run must execute on the same xdist worker
+@pytest.mark.xdist_group("mlflow_multiple_nodes")
+def test_multiple_nodes_first_run(multiple_nodes):
+    assert multiple_nodes["c_metrics"] == {"value": 10.0}
+    assert multiple_nodes["c_run"].data.metrics == {"metrics.value": 10.0}
+
+
+@pytest.mark.xdist_group("mlflow_multiple_nodes")
+def test_multiple_nodes_second_run(multiple_nodes):
+    skip_cached = multiple_nodes["skip_cached"]
+    a, b, c = multiple_nodes["nodes"]
+    b_run = multiple_nodes["b_run"]
+    client = mlflow.MlflowClient()
 
-    # find all runs with `git_commit_hash` == repo.head.commit.hexsha
-    runs = mlflow.search_runs(
-        filter_string=f"tags.git_commit_hash = '{repo.head.commit.hexsha}'"
+    # find all runs with `git_commit_hash` == sha
+    runs = client.search_runs(
+        [multiple_nodes["c_run"].info.experiment_id],
+        filter_string=f"tags.git_commit_hash = '{multiple_nodes['sha']}'",
     )
     if skip_cached:
         assert len(runs) == 3
     else:
         assert len(runs) == 4
 
-    a_run_2 = mlflow.search_runs(
-        filter_string=f"tags.git_commit_hash = '{repo.head.commit.hexsha}' and tags.dvc_stage_name = '{a.name}'",
-        output_format="list",
-    )
+    # group the runs by stage name, the parent run has no stage name
+    runs_by_stage = collections.defaultdict(list)
+    for run in runs:
+        runs_by_stage[run.data.tags.get("dvc_stage_name")].append(run)
+
+    a_run_2 = runs_by_stage[a.name]
     assert len(a_run_2) == 1
     a_run_2 = a_run_2[0]
 
-    b_run_2 = mlflow.search_runs(
-        filter_string=f"tags.git_commit_hash = '{repo.head.commit.hexsha}' and tags.dvc_stage_name = '{b.name}'",
-        output_format="list",
-    )
+    b_run_2 = runs_by_stage[b.name]
     if skip_cached:
         assert len(b_run_2) == 0
     else:
@@ -229,10 +294,7 @@ def test_multiple_nodes(mlflow_proj_path, skip_cached):
         # original runs will not be updated with a new name to indicate that they are cached
         assert b_run_2.data.tags[mlflow_tags.MLFLOW_RUN_NAME] == "ParamsToOuts_1"
 
-    c_run_2 = mlflow.search_runs(
-        filter_string=f"tags.git_commit_hash = '{repo.head.commit.hexsha}' and tags.dvc_stage_name = '{c.name}'",
-        output_format="list",
-    )
+    c_run_2 = runs_by_stage[c.name]
     assert len(c_run_2) == 1
     c_run_2 = c_run_2[0]
 
@@ -255,6 +317,7 @@ def test_multiple_nodes(mlflow_proj_path, skip_cached):
 
 
 def test_project_tags(mlflow_proj_path):
+    client = mlflow.MlflowClient()
     with zntrack.Project(tags={"lorem": "ipsum", "hello": "world"}) as proj:
         a = zntrack.examples.ParamsToOuts(params=3)
         b = zntrack.examples.ParamsToOuts(params=7)
@@ -263,14 +326,14 @@ def test_project_tags(mlflow_proj_path):
     proj.repro()
 
     with a.state.plugins["MLFlowPlugin"]:
-        a_run = mlflow.get_run(a.state.plugins["MLFlowPlugin"].child_run_id)
-        parent_run = mlflow.get_run(a.state.plugins["MLFlowPlugin"].parent_run_id)
+        a_run = client.get_run(a.state.plugins["MLFlowPlugin"].child_run_id)
+        parent_run = client.get_run(a.state.plugins["MLFlowPlugin"].parent_run_id)
 
     with b.state.plugins["MLFlowPlugin"]:
-        b_run = mlflow.get_run(b.state.plugins["MLFlowPlugin"].child_run_id)
+        b_run = client.get_run(b.state.plugins["MLFlowPlugin"].child_run_id)
 
     with c.state.plugins["MLFlowPlugin"]:
-        c_run = mlflow.get_run(c.state.plugins["MLFlowPlugin"].child_run_id)
+        c_run = client.get_run(c.state.plugins["MLFlowPlugin"].child_run_id)
 
     assert a_run.data.tags["lorem"] == "ipsum"
     assert a_run.data.tags["hello"] == "world"
@@ -286,6 +349,7 @@ def test_project_tags(mlflow_proj_path):
 
 
 def test_dataclass_deps(mlflow_proj_path):
+    client = mlflow.MlflowClient()
     t1 = T1(temperature=1)
     t2 = T2(temperature=1)
 
@@ -295,19 +359,18 @@ def test_dataclass_deps(mlflow_proj_path):
     proj.repro()
 
     with md.state.plugins["MLFlowPlugin"]:
-        run = mlflow.get_run(md.state.plugins["MLFlowPlugin"].child_run_id)
+        run = client.get_run(md.state.plugins["MLFlowPlugin"].child_run_id)
 
     assert (
         run.data.params["t"] == "[{'temperature': 1, '_cls': 'test_plugins_mlflow.T1'}]"
     )
 
     proj.finalize(msg="run1 exp.")
-    repo = git.Repo()
 
     mdx = MD.from_rev()
     assert mdx.__run_note__() != ""
     with mdx.state.plugins["MLFlowPlugin"]:
-        run = mlflow.get_run(mdx.state.plugins["MLFlowPlugin"].child_run_id)
+        run = client.get_run(mdx.state.plugins["MLFlowPlugin"].child_run_id)
     assert run.data.tags[mlflow_tags.MLFLOW_RUN_NAME] == "run1:MD"
 
     md.t = t2
@@ -316,7 +379,7 @@ def test_dataclass_deps(mlflow_proj_path):
     md = MD.from_rev()
 
     with md.state.plugins["MLFlowPlugin"]:
-        run = mlflow.get_run(md.state.plugins["MLFlowPlugin"].child_run_id)
+        run = client.get_run(md.state.plugins["MLFlowPlugin"].child_run_id)
 
     assert (
         run.data.params["t"] == "[{'temperature': 1, '_cls': 'test_plugins_mlflow.T2'}]"
@@ -326,7 +389,7 @@ def test_dataclass_deps(mlflow_proj_path):
 
     mdx = MD.from_rev()
     with mdx.state.plugins["MLFlowPlugin"]:
-        run = mlflow.get_run(mdx.state.plugins["MLFlowPlugin"].child_run_id)
+        run = client.get_run(mdx.state.plugins["MLFlowPlugin"].child_run_id)
     assert run.data.tags[mlflow_tags.MLFLOW_RUN_NAME] == "run2:MD"
 
     with zntrack.Project() as proj:
@@ -336,7 +399,7 @@ def test_dataclass_deps(mlflow_proj_path):
     md = MD.from_rev()
 
     with md.state.plugins["MLFlowPlugin"]:
-        run = mlflow.get_run(md.state.plugins["MLFlowPlugin"].child_run_id)
+        run = client.get_run(md.state.plugins["MLFlowPlugin"].child_run_id)
 
     assert (
         run.data.params["t"]
@@ -1,5 +1,6 @@
 import pathlib
-import subprocess
+
+import dvc.repo
 
 import zntrack.config
 import zntrack.examples
@@ -53,7 +54,8 @@ def test_load_ParamsToOuts_from_rev(proj_path):
     assert node.outs == zntrack.config.NOT_AVAILABLE
 
     project.build()
-    subprocess.run(["dvc", "repro"], cwd=proj_path, check=True)
+    with dvc.repo.Repo(proj_path) as repo:
+        repo.reproduce()
 
     assert node.params == 42
     assert node.outs == 42
@@ -73,7 +75,8 @@ def test_load_WriteDVCOuts_from_rev(proj_path):
     assert node.outs == zntrack.config.NOT_AVAILABLE
 
     project.build()
-    subprocess.run(["dvc", "repro"], cwd=proj_path, check=True)
+    with dvc.repo.Repo(proj_path) as repo:
+        repo.reproduce()
 
     assert node.params == 42
     assert node.outs == pathlib.Path("nodes/WriteDVCOuts/output.txt")
@@ -1,6 +1,12 @@
 import pytest
+from fsspec.implementations.local import LocalFileSystem
 
-from zntrack.utils.misc import sort_and_deduplicate
+from zntrack.utils.misc import (
+    is_commit_sha,
+    load_file_cached,
+    sort_and_deduplicate,
+    write_text_if_changed,
+)
 
 
 def test_mixed_types():
@@ -69,3 +75,35 @@ def test_different_parameter_and_type_rev():
     ]
     with pytest.raises(ValueError):
         sort_and_deduplicate(data)
+
+
+def test_write_text_if_changed(tmp_path):
+    path = tmp_path / "file.txt"
+    assert write_text_if_changed(path, "a") is True
+    assert write_text_if_changed(path, "a") is False
+    assert write_text_if_changed(path, "b") is True
+    assert path.read_text() == "b"
+
+
+def test_load_file_cached(tmp_path):
+    fs = LocalFileSystem()
+    path = tmp_path / "params.yaml"
+    path.write_text("a: 1\n")
+    assert load_file_cached(fs, path) == {"a": 1}
+    assert load_file_cached(fs, path) is load_file_cached(fs, path)
+
+    path.write_text("a: 10\n")
+    assert load_file_cached(fs, path) == {"a": 10}
+
+    # same size and possibly the same mtime
+    path.write_text("a: 20\n")
+    assert load_file_cached(fs, path) == {"a": 20}
+
+
+def test_is_commit_sha():
+    assert is_commit_sha("a" * 40)
+    assert is_commit_sha("0123456789ABCDEF0123456789abcdef01234567")
+    assert not is_commit_sha(None)
+    assert not is_commit_sha("HEAD")
+    assert not is_commit_sha("main")
+    assert not is_commit_sha("a" * 7)
@@ -3,7 +3,6 @@
 import contextlib
 import datetime
 import importlib.metadata
-import os
 import pathlib
 import sys
 
@@ -12,9 +11,7 @@ import typer
 import yaml
 
 from zntrack import Node, utils
-from zntrack.state import PLUGIN_LIST
-from zntrack.utils.import_handler import import_handler
-from zntrack.utils.misc import load_env_vars
+from zntrack.utils.misc import get_plugin_classes_from_env, load_env_vars
 
 load_env_vars()
 
@@ -107,9 +104,5 @@ def finalize(
 ):
     """Post-commit step for plugin integration."""
     utils.misc.load_env_vars()
-    plugins_paths = os.environ.get(
-        "ZNTRACK_PLUGINS", "zntrack.plugins.dvc_plugin.DVCPlugin"
-    )
-    plugins: PLUGIN_LIST = [import_handler(p) for p in plugins_paths.split(",")]
-    for plugin in plugins:
+    for plugin in get_plugin_classes_from_env():
         plugin.finalize(skip_cached=skip_cached, update_run_names=update_run_names)
@@ -1,3 +1,4 @@
+import copy
 import dataclasses
 import importlib
 import pathlib
@@ -5,9 +6,9 @@ import subprocess
 import typing as t
 import warnings
 
-import yaml
 import znflow
 import znjson
+from fsspec.implementations.local import LocalFileSystem
 
 from zntrack.add import DVCImportPath
 from zntrack.config import (
@@ -20,6 +21,7 @@ from zntrack.config import (
 
 from .node import Node
 from .utils import module_handler
+from .utils.misc import load_file_cached
 
 
 class DataclassContainer:
@@ -40,20 +42,29 @@ class DataclassContainer:
             is a list of dataclasses. None if a single dataclass.
 
         """
-        all_params = yaml.safe_load(PARAMS_FILE_PATH.read_text())
+        all_params = load_file_cached(LocalFileSystem(), PARAMS_FILE_PATH)
         if index is not None:
             dc_params = all_params[node_name][attr_name][index]
         else:
             dc_params = all_params[node_name][attr_name]
+        # copy, because the parsed file is shared between all nodes
+        dc_params = copy.deepcopy(dc_params)
         dc_params.pop("_cls", None)
         return self.cls(**dc_params)
 
 
+def _as_posix(path: str | pathlib.PurePath) -> str:
+    # avoid constructing a second path object for values that already are one
+    if isinstance(path, pathlib.PurePath):
+        return path.as_posix()
+    return pathlib.PurePath(path).as_posix()
+
+
 def _enforce_str_list(content) -> list[str]:
-    if isinstance(content, (str, pathlib.Path)):
-        return [pathlib.Path(content).as_posix()]
+    if isinstance(content, (str, pathlib.PurePath)):
+        return [_as_posix(content)]
     elif isinstance(content, (list, tuple)):
-        return [pathlib.Path(x).as_posix() for x in content]
+        return [_as_posix(x) for x in content]
     else:
         raise ValueError(f"found unsupported content type '{content}'")
 
@@ -6,6 +6,7 @@ from zntrack import config
 from zntrack.config import NOT_AVAILABLE, ZnTrackOptionEnum
 from zntrack.fields.base import field
 from zntrack.node import Node
+from zntrack.utils.node_wd import make_nwd
 
 
 def _outs_getter(self: "Node", name: str, suffix: str):
@@ -14,21 +15,19 @@ def _outs_getter(self: "Node", name: str, suffix: str):
 
 
 def _outs_save_func(self: "Node", name: str, suffix: str):
-    self.nwd.mkdir(parents=True, exist_ok=True)
+    nwd = make_nwd(self)
     try:
-        (self.nwd / name).with_suffix(suffix).write_text(
-            znjson.dumps(getattr(self, name))
-        )
+        (nwd / name).with_suffix(suffix).write_text(znjson.dumps(getattr(self, name)))
     except TypeError as err:
-        raise TypeError(f"Error while saving {name} to {self.nwd / name}.json") from err
+        raise TypeError(f"Error while saving {name} to {nwd / name}.json") from err
 
 
 def _metrics_save_func(self: "Node", name: str, suffix: str):
-    self.nwd.mkdir(parents=True, exist_ok=True)
+    nwd = make_nwd(self)
     try:
-        (self.nwd / name).with_suffix(suffix).write_text(json.dumps(getattr(self, name)))
+        (nwd / name).with_suffix(suffix).write_text(json.dumps(getattr(self, name)))
     except TypeError as err:
-        raise TypeError(f"Error while saving {name} to {self.nwd / name}.json") from err
+        raise TypeError(f"Error while saving {name} to {nwd / name}.json") from err
 
 
 def outs(*, cache: bool = True, independent: bool = False, **kwargs):
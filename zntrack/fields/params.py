@@ -1,15 +1,16 @@
+import copy
 import dataclasses
 
-import yaml
-
 from zntrack.config import PARAMS_FILE_PATH, ZnTrackOptionEnum
 from zntrack.fields.base import field
 from zntrack.node import Node
+from zntrack.utils.misc import load_file_cached
 
 
 def _params_getter(self: "Node", name: str):
-    with self.state.fs.open(PARAMS_FILE_PATH) as f:
-        return yaml.safe_load(f)[self.name][name]
+    # copy, because the parsed file is shared between all nodes
+    content = load_file_cached(self.state.fs, PARAMS_FILE_PATH)[self.name][name]
+    return copy.deepcopy(content)
 
 
 def params(default=dataclasses.MISSING, **kwargs):
@@ -3,19 +3,20 @@ import pandas as pd
 from zntrack.config import NOT_AVAILABLE, ZNTRACK_OPTION_PLOTS_CONFIG, ZnTrackOptionEnum
 from zntrack.fields.base import field
 from zntrack.node import Node
+from zntrack.utils.node_wd import make_nwd
 
 
 def _plots_save_func(self: "Node", name: str, suffix: str):
-    self.nwd.mkdir(parents=True, exist_ok=True)
+    nwd = make_nwd(self)
     content = getattr(self, name)
     if not isinstance(content, pd.DataFrame):
         raise TypeError(f"Expected a pandas DataFrame, got {type(content)}")
-    content.to_csv((self.nwd / name).with_suffix(suffix))
+    content.to_csv((nwd / name).with_suffix(suffix))
 
 
 def _plots_autosave_setter(self: Node, name: str, value: pd.DataFrame):
-    self.nwd.mkdir(parents=True, exist_ok=True)
-    value.to_csv((self.nwd / name).with_suffix(".csv"))
+    nwd = make_nwd(self)
+    value.to_csv((nwd / name).with_suffix(".csv"))
     self.__dict__[name] = value
 
 
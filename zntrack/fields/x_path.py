@@ -19,7 +19,7 @@ from zntrack.config import (
 # if t.TYPE_CHECKING:
 from zntrack.node import Node
 from zntrack.plugins import plugin_getter
-from zntrack.utils.misc import TempPathLoader
+from zntrack.utils.misc import TempPathLoader, load_file_cached
 from zntrack.utils.node_wd import NWDReplaceHandler
 
 
@@ -33,17 +33,16 @@ def _paths_getter(self: Node, name: str):
     if name in self.__dict__ and self.__dict__[name] is not ZNTRACK_LAZY_VALUE:
         return nwd_handler(self.__dict__[name], nwd=self.nwd)
     try:
-        with self.state.fs.open(ZNTRACK_FILE_PATH) as f:
-            content = json.load(f)[self.name][name]
-            content = znjson.loads(json.dumps(content))
+        content = load_file_cached(self.state.fs, ZNTRACK_FILE_PATH)[self.name][name]
+        content = znjson.loads(json.dumps(content))
 
-            if self.state.tmp_path is not None:
-                loader = TempPathLoader()
-                loader(content, instance=self)
+        if self.state.tmp_path is not None:
+            loader = TempPathLoader()
+            loader(content, instance=self)
 
-            content = nwd_handler(content, nwd=self.nwd)
+        content = nwd_handler(content, nwd=self.nwd)
 
-            return content
+        return content
     except FileNotFoundError:
         return NOT_AVAILABLE
 
@@ -1,26 +1,62 @@
 import contextlib
+import functools
 import importlib
 import importlib.util
 import pathlib
 import sys
 
-import dvc.api
-import dvc.repo
-import dvc.stage
+from zntrack.utils.misc import is_commit_sha
 
 
-def from_rev(name: str, remote: str | None = None, rev: str | None = None):
+def _collect_stage_cmds(remote: str | None, rev: str | None) -> dict[str, str]:
+    """Map all pipeline stage names to their cmd for the given remote and rev."""
+    import dvc.api
+
     fs = dvc.api.DVCFileSystem(url=remote, rev=rev)
+    cmds = {}
     with fs.repo as repo:
-        # with dvc.repo.Repo(remote=remote, rev=rev) as repo:
         for stage in repo.index.stages:
             with contextlib.suppress(AttributeError):
                 # only PipelineStages have a name attribute
-                if stage.name == name:
-                    cmd = stage.cmd
-                    break
-        else:
-            raise ValueError(f"Stage {name} not found in {repo}")
+                cmds[stage.name] = stage.cmd
+    return cmds
+
+
+@functools.lru_cache(maxsize=128)
+def _get_stage_cmds(
+    remote: str | None, rev: str | None, cwd: str, dvc_yaml: str | None
+) -> dict[str, str]:
+    # 'cwd' and the 'dvc_yaml' content are only part of the cache key
+    return _collect_stage_cmds(remote, rev)
+
+
+def _load_stage_cmds(remote: str | None, rev: str | None) -> dict[str, str]:
+    """Get the stage cmds, cached for the workspace and for full commit SHAs.
+
+    The workspace is cached until the content of 'dvc.yaml' changes.
+    Other revisions, e.g. 'HEAD' or a branch, can move and are always
+    looked up again.
+    """
+    cwd = pathlib.Path.cwd().as_posix()
+    if remote is None and rev is None:
+        with contextlib.suppress(FileNotFoundError):
+            dvc_yaml = pathlib.Path("dvc.yaml").read_text()
+            return _get_stage_cmds(None, None, cwd, dvc_yaml)
+    elif is_commit_sha(rev):
+        return _get_stage_cmds(remote, rev, cwd, None)
+    return _collect_stage_cmds(remote, rev)
+
+
+def from_rev(name: str, remote: str | None = None, rev: str | None = None):
+    cwd = pathlib.Path.cwd().as_posix()
+    cmds = _load_stage_cmds(remote, rev)
+    if name not in cmds and remote is None and rev is None:
+        # the stage might be defined in a nested 'dvc.yaml'
+        cmds = _collect_stage_cmds(remote, rev)
+    try:
+        cmd = cmds[name]
+    except KeyError:
+        raise ValueError(f"Stage {name} not found in {remote or cwd}") from None
 
     # cmd will be "zntrack run module.name --name ..." and we need the module.name and --name part
     run_str = cmd.split()[2]
@@ -28,7 +64,7 @@ def from_rev(name: str, remote: str | None = None, rev: str | None = None):
 
     package_and_module, cls_name = run_str.rsplit(".", 1)
 
-    sys.path.append(pathlib.Path.cwd().as_posix())
+    sys.path.append(cwd)
     if remote is not None:
         # check if remote is a path that exists
         if pathlib.Path(remote).exists():
@@ -1,11 +1,14 @@
 import contextlib
 import dataclasses
 import datetime
+import functools
 import json
+import os
 import pathlib
 import typing as t
 import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import typing_extensions as te
 import znfields
@@ -22,6 +25,9 @@ try:
 except ImportError:
     from typing_extensions import dataclass_transform
 
+if t.TYPE_CHECKING:
+    from zntrack.plugins import ZnTrackPlugin
+
 T = t.TypeVar("T", bound="Node")
 
 
@@ -37,6 +43,18 @@ def _name_getter(self, name):
     return graph.compute_all_node_names()[self.uuid]
 
 
+def _save_field(plugin: "ZnTrackPlugin", field: dataclasses.Field) -> None:
+    try:
+        plugin.save(field)
+    except Exception as err:  # noqa: E722
+        if plugin._continue_on_error_:
+            warnings.warn(
+                f"Plugin {plugin.__class__.__name__} failed to save field {field.name}."
+            )
+        else:
+            raise err
+
+
 @dataclass_transform()
 @dataclasses.dataclass(kw_only=True)
 class Node(znflow.Node, znfields.Base):
@@ -62,23 +80,27 @@ class Node(znflow.Node, znfields.Base):
         raise NotImplementedError
 
     def save(self):
+        # with 'ZNTRACK_PARALLEL_IO=1' the fields of thread-safe plugins are saved
+        # concurrently. Others, e.g. MLflow with its thread-local active run,
+        # always save serially.
+        parallel = os.environ.get("ZNTRACK_PARALLEL_IO", "0") == "1"
+        fields = dataclasses.fields(self)
+        # the values do not depend on the plugin, so check them only once
+        for field in fields:
+            value = getattr(self, field.name)
+            if value is ZNTRACK_LAZY_VALUE or value is NOT_AVAILABLE:
+                raise ValueError(
+                    f"Field '{field.name}' is not set. Please set it before saving."
+                )
         for plugin in self.state.plugins.values():
             with plugin:
-                for field in dataclasses.fields(self):
-                    value = getattr(self, field.name)
-                    if any(value is x for x in [ZNTRACK_LAZY_VALUE, NOT_AVAILABLE]):
-                        raise ValueError(
-                            f"Field '{field.name}' is not set. Please set it before saving."
-                        )
-                    try:
-                        plugin.save(field)
-                    except Exception as err:  # noqa: E722
-                        if plugin._continue_on_error_:
-                            warnings.warn(
-                                f"Plugin {plugin.__class__.__name__} failed to save field {field.name}."
-                            )
-                        else:
-                            raise err
+                save_field = functools.partial(_save_field, plugin)
+                if parallel and plugin._thread_safe_ and len(fields) > 1:
+                    with ThreadPoolExecutor(max_workers=min(8, len(fields))) as pool:
+                        list(pool.map(save_field, fields))
+                else:
+                    for field in fields:
+                        save_field(field)
 
         _ = self.state
         self.__dict__["state"]["state"] = NodeStatusEnum.FINISHED
@@ -102,8 +124,9 @@ class Node(znflow.Node, znfields.Base):
     ) -> T:
         if name is None:
             name = cls.__name__
+        fields = dataclasses.fields(cls)
         lazy_values = {}
-        for field in dataclasses.fields(cls):
+        for field in fields:
             # check if the field is in the init
             if field.init:
                 lazy_values[field.name] = ZNTRACK_LAZY_VALUE
@@ -140,7 +163,7 @@ class Node(znflow.Node, znfields.Base):
                 )
 
         if not instance.state.lazy_evaluation:
-            for field in dataclasses.fields(cls):
+            for field in fields:
                 _ = getattr(instance, field.name)
 
         instance._external_ = True
@@ -21,9 +21,10 @@ if t.TYPE_CHECKING:
 def plugin_getter(self: "Node", name: str):
     value = PLUGIN_EMPTY_RETRUN_VALUE
 
-    field = self.state.get_field(name)
+    state = self.state
+    field = state.get_field(name)
 
-    for plugin in self.state.plugins.values():
+    for plugin in state.plugins.values():
         getter_value = plugin.getter(field)
         # TODO: is saving / loading part of a plugin or default feature?
         if getter_value is not PLUGIN_EMPTY_RETRUN_VALUE:
@@ -68,6 +69,8 @@ class ZnTrackPlugin(abc.ABC):
 
     node: "Node"
     _continue_on_error_ = False
+    # only plugins without shared state may save fields from multiple threads
+    _thread_safe_ = False
 
     @abc.abstractmethod
     def getter(self, field: dataclasses.Field) -> t.Any:
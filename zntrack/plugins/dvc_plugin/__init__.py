@@ -43,6 +43,8 @@ from zntrack.utils.node_wd import NWDReplaceHandler, nwd
 
 @dataclasses.dataclass
 class DVCPlugin(ZnTrackPlugin):
+    _thread_safe_ = True
+
     def getter(self, field: dataclasses.Field) -> t.Any:
         getter = field.metadata.get(ZNTRACK_FIELD_LOAD)
         suffix = field.metadata.get(ZNTRACK_FIELD_SUFFIX)
@@ -122,6 +124,8 @@ class DVCPlugin(ZnTrackPlugin):
 
     def convert_to_dvc_yaml(self) -> dict | object:
         node_dict = converter.NodeConverter().encode(self.node)
+        # resolving the nwd creates a new NodeStatus, so only do it once
+        node_wd = self.node.nwd
 
         cmd = f"zntrack run {node_dict['module']}.{node_dict['cls']} --name {node_dict['name']}"
         if hasattr(self.node, "_method"):
@@ -129,11 +133,7 @@ class DVCPlugin(ZnTrackPlugin):
         stages = {
             "cmd": cmd,
             "metrics": [
-                {
-                    (self.node.nwd / "node-meta.json").as_posix(): {
-                        "cache": config.ALWAYS_CACHE
-                    }
-                }
+                {(node_wd / "node-meta.json").as_posix(): {"cache": config.ALWAYS_CACHE}}
             ],
         }
         if self.node.always_changed:
@@ -143,19 +143,20 @@ class DVCPlugin(ZnTrackPlugin):
         nwd_handler = NWDReplaceHandler()
 
         for field in dataclasses.fields(self.node):
-            if field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.PARAMS:
+            option = field.metadata.get(ZNTRACK_OPTION)
+            if option == ZnTrackOptionEnum.PARAMS:
                 stages.setdefault(ZnTrackOptionEnum.PARAMS.value, []).append(
                     self.node.name
                 )
-            elif field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.PARAMS_PATH:
+            elif option == ZnTrackOptionEnum.PARAMS_PATH:
                 if getattr(self.node, field.name) is None:
                     continue
                 content = nwd_handler(
-                    get_attr_always_list(self.node, field.name), nwd=self.node.nwd
+                    get_attr_always_list(self.node, field.name), nwd=node_wd
                 )
                 content = [{pathlib.Path(x).as_posix(): None} for x in content]
                 stages.setdefault(ZnTrackOptionEnum.PARAMS.value, []).extend(content)
-            elif field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.OUTS_PATH:
+            elif option == ZnTrackOptionEnum.OUTS_PATH:
                 if getattr(self.node, field.name) is None:
                     continue
                 if getattr(self.node, field.name) == nwd:
@@ -163,49 +164,47 @@ class DVCPlugin(ZnTrackPlugin):
                         "Can not use 'zntrack.nwd' direclty as an output path. Please use 'zntrack.nwd / <path/file>' instead."
                     )
                 content = nwd_handler(
-                    get_attr_always_list(self.node, field.name), nwd=self.node.nwd
+                    get_attr_always_list(self.node, field.name), nwd=node_wd
                 )
                 content = [pathlib.Path(x).as_posix() for x in content]
                 if field.metadata.get(ZNTRACK_CACHE) is False:
                     content = [{c: {"cache": False}} for c in content]
                 stages.setdefault(ZnTrackOptionEnum.OUTS.value, []).extend(content)
-            elif field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.PLOTS_PATH:
+            elif option == ZnTrackOptionEnum.PLOTS_PATH:
                 if getattr(self.node, field.name) is None:
                     continue
                 content = nwd_handler(
-                    get_attr_always_list(self.node, field.name), nwd=self.node.nwd
+                    get_attr_always_list(self.node, field.name), nwd=node_wd
                 )
                 content = [pathlib.Path(x).as_posix() for x in content]
                 if field.metadata.get(ZNTRACK_CACHE) is False:
                     content = [{c: {"cache": False}} for c in content]
                 stages.setdefault(ZnTrackOptionEnum.OUTS.value, []).extend(content)
                 # plots[self.node.name] = None
-            elif field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.METRICS_PATH:
+            elif option == ZnTrackOptionEnum.METRICS_PATH:
                 if getattr(self.node, field.name) is None:
                     continue
                 content = nwd_handler(
-                    get_attr_always_list(self.node, field.name), nwd=self.node.nwd
+                    get_attr_always_list(self.node, field.name), nwd=node_wd
                 )
                 content = [pathlib.Path(x).as_posix() for x in content]
                 if field.metadata.get(ZNTRACK_CACHE) is False:
                     content = [{c: {"cache": False}} for c in content]
                 stages.setdefault(ZnTrackOptionEnum.METRICS.value, []).extend(content)
-            elif field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.OUTS:
+            elif option == ZnTrackOptionEnum.OUTS:
                 suffix = field.metadata[ZNTRACK_FIELD_SUFFIX]
-                content = [(self.node.nwd / field.name).with_suffix(suffix).as_posix()]
+                content = [(node_wd / field.name).with_suffix(suffix).as_posix()]
                 if field.metadata.get(ZNTRACK_CACHE) is False:
                     content = [{c: {"cache": False}} for c in content]
                 stages.setdefault(ZnTrackOptionEnum.OUTS.value, []).extend(content)
-            elif field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.PLOTS:
+            elif option == ZnTrackOptionEnum.PLOTS:
                 suffix = field.metadata[ZNTRACK_FIELD_SUFFIX]
-                content = [(self.node.nwd / field.name).with_suffix(suffix).as_posix()]
+                content = [(node_wd / field.name).with_suffix(suffix).as_posix()]
                 if field.metadata.get(ZNTRACK_CACHE) is False:
                     content = [{c: {"cache": False}} for c in content]
                 stages.setdefault(ZnTrackOptionEnum.OUTS.value, []).extend(content)
                 if ZNTRACK_OPTION_PLOTS_CONFIG in field.metadata:
-                    file_path = (
-                        (self.node.nwd / field.name).with_suffix(suffix).as_posix()
-                    )
+                    file_path = (node_wd / field.name).with_suffix(suffix).as_posix()
                     plots_config = field.metadata[ZNTRACK_OPTION_PLOTS_CONFIG].copy()
                     if "x" not in plots_config or "y" not in plots_config:
                         raise ValueError(
@@ -222,13 +221,13 @@ class DVCPlugin(ZnTrackPlugin):
                         if "y" in plots_config:
                             plots_config["y"] = {file_path: plots_config["y"]}
                         plots.append({f"{self.node.name}_{field.name}": plots_config})
-            elif field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.METRICS:
+            elif option == ZnTrackOptionEnum.METRICS:
                 suffix = field.metadata[ZNTRACK_FIELD_SUFFIX]
-                content = [(self.node.nwd / field.name).with_suffix(suffix).as_posix()]
+                content = [(node_wd / field.name).with_suffix(suffix).as_posix()]
                 if field.metadata.get(ZNTRACK_CACHE) is False:
                     content = [{c: {"cache": False}} for c in content]
                 stages.setdefault(ZnTrackOptionEnum.METRICS.value, []).extend(content)
-            elif field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.DEPS:
+            elif option == ZnTrackOptionEnum.DEPS:
                 if getattr(self.node, field.name) is None:
                     continue
                 content = get_attr_always_list(self.node, field.name)
@@ -263,7 +262,7 @@ class DVCPlugin(ZnTrackPlugin):
 
                 if len(paths) > 0:
                     stages.setdefault(ZnTrackOptionEnum.DEPS.value, []).extend(paths)
-            elif field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.DEPS_PATH:
+            elif option == ZnTrackOptionEnum.DEPS_PATH:
                 if getattr(self.node, field.name) is None:
                     continue
                 content = [
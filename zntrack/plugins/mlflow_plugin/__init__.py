@@ -1,6 +1,7 @@
 import contextlib
 import dataclasses
 import pathlib
+import time
 import warnings
 from dataclasses import Field, dataclass
 from typing import Any
@@ -11,6 +12,7 @@ import mlflow
 import pandas as pd
 import yaml
 import znflow
+from mlflow.entities import Metric
 from mlflow.utils import mlflow_tags
 
 from zntrack.config import (
@@ -24,6 +26,9 @@ from zntrack.plugins import ZnTrackPlugin, get_exp_info, set_exp_info
 from zntrack.utils import module_handler
 from zntrack.utils.misc import load_env_vars
 
+# maximum number of metrics the MLflow server accepts in a single 'log_batch' request
+MLFLOW_MAX_METRICS_PER_BATCH = 1000
+
 # TODO: if this plugin fails, there should only be a warning, not an error
 # so that the results are not lost
 # TODO: have the mlflow run active over the entire run method to avoid searching for it over again.
@@ -81,6 +86,15 @@ def get_mlflow_child_run(stage_hash: str, node: Node, node_path: str) -> str:
         return run_id
 
 
+def log_metrics_batched(run_id: str, metrics: list[Metric]) -> None:
+    """Log metrics in as few 'log_batch' requests as the server limit allows."""
+    client = mlflow.MlflowClient()
+    for start in range(0, len(metrics), MLFLOW_MAX_METRICS_PER_BATCH):
+        client.log_batch(
+            run_id=run_id, metrics=metrics[start : start + MLFLOW_MAX_METRICS_PER_BATCH]
+        )
+
+
 @dataclass
 class MLFlowPlugin(ZnTrackPlugin):
     """ZnTrack integration with MLFlow.
@@ -168,15 +182,26 @@ class MLFlowPlugin(ZnTrackPlugin):
 
         if field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.METRICS:
             metrics = getattr(self.node, field.name)
-            for key, value in metrics.items():
-                mlflow.log_metric(f"{field.name}.{key}", value)
-                # TODO: plots
-                # TODO: define tags for all experiments in a parent run
+            timestamp = int(time.time() * 1000)
+            log_metrics_batched(
+                mlflow.active_run().info.run_id,
+                [
+                    Metric(f"{field.name}.{key}", float(value), timestamp, 0)
+                    for key, value in metrics.items()
+                ],
+            )
+            # TODO: define tags for all experiments in a parent run
         if field.metadata.get(ZNTRACK_OPTION) == ZnTrackOptionEnum.PLOTS:
-            df: pd.DataFrame = getattr(self.node, field.name).copy()
-            for idx, row in df.iterrows():
-                for key, value in row.items():
-                    mlflow.log_metric(f"{field.name}.{key}", value, step=idx)
+            df: pd.DataFrame = getattr(self.node, field.name)
+            timestamp = int(time.time() * 1000)
+            log_metrics_batched(
+                mlflow.active_run().info.run_id,
+                [
+                    Metric(f"{field.name}.{key}", float(value), timestamp, int(idx))
+                    for idx, row in df.iterrows()
+                    for key, value in row.items()
+                ],
+            )
 
     def convert_to_dvc_yaml(self):
         return PLUGIN_EMPTY_RETRUN_VALUE
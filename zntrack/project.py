@@ -1,7 +1,6 @@
 import contextlib
 import json
 import logging
-import os
 import subprocess
 import uuid
 
@@ -11,10 +10,13 @@ import znflow
 
 from zntrack import utils
 from zntrack.group import Group
-from zntrack.state import PLUGIN_LIST
 from zntrack.utils.finalize import make_commit
-from zntrack.utils.import_handler import import_handler
-from zntrack.utils.misc import load_env_vars
+from zntrack.utils.misc import (
+    clear_caches,
+    get_plugin_classes_from_env,
+    load_env_vars,
+    write_text_if_changed,
+)
 
 from . import config
 from .deployment import ZnTrackDeployment
@@ -48,13 +50,16 @@ class Project(znflow.DiGraph):
         """Compute the Node name based on existing nodes on the graph."""
         all_nodes = [self.nodes[uuid]["value"] for uuid in self.nodes]
         node_names = {}
+        # set of assigned names to avoid scanning 'node_names.values()' per lookup
+        used_names = set()
         for node in all_nodes:
             if "name" in node.__dict__ and node.__dict__["name"] is not None:
-                if node.__dict__["name"] in node_names.values():
+                if node.__dict__["name"] in used_names:
                     raise ValueError(
                         f"A node with the name '{node.__dict__['name']}' already exists."
                     )
                 node_names[node.uuid] = node.__dict__["name"]
+                used_names.add(node.__dict__["name"])
             else:
                 if node.state.group is None:
                     if self.active_group is not None:
@@ -65,15 +70,16 @@ class Project(znflow.DiGraph):
                     node_name = (
                         f"{'_'.join(node.state.group.name)}_{node.__class__.__name__}"
                     )
-                if node_name not in node_names.values():
+                if node_name not in used_names:
                     node_names[node.uuid] = node_name
                 else:
                     i = 0
                     while True:
                         i += 1
-                        if f"{node_name}_{i}" not in node_names.values():
+                        if f"{node_name}_{i}" not in used_names:
                             node_names[node.uuid] = f"{node_name}_{i}"
                             break
+                used_names.add(node_names[node.uuid])
         return node_names
 
     def add_node(self, node_for_adding, **attr):
@@ -135,9 +141,12 @@ class Project(znflow.DiGraph):
         if len(dvc_dict["plots"]) == 0:
             del dvc_dict["plots"]
 
-        config.PARAMS_FILE_PATH.write_text(yaml.safe_dump(params_dict))
-        config.DVC_FILE_PATH.write_text(yaml.safe_dump(dvc_dict))
-        config.ZNTRACK_FILE_PATH.write_text(json.dumps(zntrack_dict, indent=4))
+        write_text_if_changed(config.PARAMS_FILE_PATH, yaml.safe_dump(params_dict))
+        write_text_if_changed(config.DVC_FILE_PATH, yaml.safe_dump(dvc_dict))
+        write_text_if_changed(
+            config.ZNTRACK_FILE_PATH, json.dumps(zntrack_dict, indent=4)
+        )
+        clear_caches()
 
         # TODO: update file or overwrite?
 
@@ -182,12 +191,9 @@ class Project(znflow.DiGraph):
             msg = "zntrack: auto commit"
         if commit:
             make_commit(msg, **kwargs)
+        clear_caches()
         utils.misc.load_env_vars()
-        plugins_paths = os.environ.get(
-            "ZNTRACK_PLUGINS", "zntrack.plugins.dvc_plugin.DVCPlugin"
-        )
-        plugins: PLUGIN_LIST = [import_handler(p) for p in plugins_paths.split(",")]
-        for plugin in plugins:
+        for plugin in get_plugin_classes_from_env():
             plugin.finalize(skip_cached=skip_cached, update_run_names=update_run_names)
 
     @contextlib.contextmanager
@@ -1,6 +1,7 @@
 import contextlib
 import dataclasses
 import datetime
+import functools
 import importlib.metadata
 import json
 import pathlib
@@ -8,25 +9,38 @@ import tempfile
 import typing as t
 import warnings
 
-import dvc.api
-import dvc.repo
-import dvc.stage.serialize
-from dvc.utils import dict_sha256
 from fsspec.implementations.local import LocalFileSystem
 from fsspec.spec import AbstractFileSystem
 
 from zntrack.config import NodeStatusEnum
 from zntrack.group import Group
 from zntrack.plugins import ZnTrackPlugin
-from zntrack.utils.node_wd import get_nwd
+from zntrack.utils.misc import is_commit_sha
+from zntrack.utils.node_wd import get_nwd, make_nwd
 
 if t.TYPE_CHECKING:
+    import dvc.api
+    import dvc.stage
+
     from zntrack import Node
 
 PLUGIN_LIST = list[t.Type[ZnTrackPlugin]]
 PLUGIN_DICT = dict[str, ZnTrackPlugin]
 
 
+@functools.lru_cache(maxsize=32)
+def _get_dvc_fs(remote: str | None, rev: str, cwd: str) -> "dvc.api.DVCFileSystem":
+    """Share one DVCFileSystem between all nodes loaded from the same commit.
+
+    Only call this with a full commit SHA, see 'is_commit_sha'.
+    The 'cwd' is part of the cache key, because the local repository
+    is used if 'remote' is None.
+    """
+    import dvc.api
+
+    return dvc.api.DVCFileSystem(url=remote, rev=rev)
+
+
 @dataclasses.dataclass(frozen=True)
 class NodeStatus:
     remote: str | None = None
@@ -60,18 +74,17 @@ class NodeStatus:
         """Get the file system of the Node."""
         if self.remote is None and self.rev is None:
             return LocalFileSystem()
-        return dvc.api.DVCFileSystem(
-            url=self.remote,
-            rev=self.rev,
-        )
+        return self.dvc_fs
 
     @property
-    def dvc_fs(self) -> dvc.api.DVCFileSystem:
+    def dvc_fs(self) -> "dvc.api.DVCFileSystem":
         """Get the file system of the Node."""
-        return dvc.api.DVCFileSystem(
-            url=self.remote,
-            rev=self.rev,
-        )
+        import dvc.api
+
+        if is_commit_sha(self.rev):
+            # commits can not change, share the file system between nodes
+            return _get_dvc_fs(self.remote, self.rev, pathlib.Path.cwd().as_posix())
+        return dvc.api.DVCFileSystem(url=self.remote, rev=self.rev)
 
     @property
     def restarted(self) -> bool:
@@ -111,7 +124,7 @@ class NodeStatus:
             finally:
                 self.node.__dict__["state"].pop("tmp_path")
 
-    def get_stage(self) -> dvc.stage.Stage:
+    def get_stage(self) -> "dvc.stage.Stage":
         """Access to the internal dvc.repo api."""
         stage = next(iter(self.dvc_fs.repo.stage.collect(self.name)))
         if self.rev is None and self.remote is None:
@@ -122,11 +135,15 @@ class NodeStatus:
 
     def get_stage_lock(self) -> dict:
         """Access to the internal dvc.repo api."""
+        import dvc.stage.serialize
+
         stage = self.get_stage()
         return dvc.stage.serialize.to_single_stage_lockfile(stage)
 
     def get_stage_hash(self, include_outs: bool = False) -> str:
         """Get the hash of the stage."""
+        from dvc.utils import dict_sha256
+
         stage_lock = self.get_stage_lock()
 
         if include_outs:
@@ -139,9 +156,12 @@ class NodeStatus:
 
     def to_dict(self) -> dict:
         """Convert the NodeStatus to a dictionary."""
-        content = dataclasses.asdict(self)
-        content.pop("node")
-        return content
+        # shallow on purpose, 'dataclasses.asdict' would deepcopy e.g. the group
+        return {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.name != "node"
+        }
 
     def get_field(self, attribute: str) -> dataclasses.Field:
         fields = dataclasses.fields(self.node)
@@ -174,5 +194,5 @@ class NodeStatus:
         with contextlib.suppress(importlib.metadata.PackageNotFoundError):
             module = self.node.__module__.split(".")[0]
             node_meta_content["package_version"] = importlib.metadata.version(module)
-        self.nwd.mkdir(parents=True, exist_ok=True)
-        (self.nwd / "node-meta.json").write_text(json.dumps(node_meta_content, indent=2))
+        nwd = make_nwd(self.node)
+        (nwd / "node-meta.json").write_text(json.dumps(node_meta_content, indent=2))
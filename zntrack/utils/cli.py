@@ -2,8 +2,6 @@ import json
 import pathlib
 from typing import Tuple
 
-from dvc.api import DVCFileSystem
-
 from zntrack.config import ZNTRACK_FILE_PATH
 
 
@@ -26,6 +24,8 @@ def get_groups(remote, rev) -> Tuple[dict, list]:
         A list of all node names in the project.
 
     """
+    from dvc.api import DVCFileSystem
+
     fs = DVCFileSystem(url=remote, rev=rev)
     with fs.open(ZNTRACK_FILE_PATH) as f:
         config = json.load(f)
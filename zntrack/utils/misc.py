@@ -1,9 +1,15 @@
+import contextlib
+import functools
+import json
 import os
 import pathlib
+import re
 import typing as t
 
 import yaml
 import znflow.utils
+from fsspec.implementations.local import LocalFileSystem
+from fsspec.spec import AbstractFileSystem
 
 from zntrack.add import DVCImportPath
 from zntrack.utils.import_handler import import_handler
@@ -19,11 +25,24 @@ class RunDVCImportPathHandler(znflow.utils.IterableHandler):
             value.run()
 
 
-def get_plugins_from_env(self):
+@functools.lru_cache(maxsize=None)
+def _import_plugins(plugins_paths: str) -> tuple[type, ...]:
+    return tuple(import_handler(p) for p in plugins_paths.split(","))
+
+
+def get_plugin_classes_from_env() -> tuple[type, ...]:
+    """Get the plugin classes defined in the 'ZNTRACK_PLUGINS' environment variable.
+
+    The classes are resolved once per distinct value of the variable.
+    """
     plugins_paths = os.environ.get(
         "ZNTRACK_PLUGINS", "zntrack.plugins.dvc_plugin.DVCPlugin"
     )
-    plugins = [import_handler(p) for p in plugins_paths.split(",")]
+    return _import_plugins(plugins_paths)
+
+
+def get_plugins_from_env(self):
+    plugins = get_plugin_classes_from_env()
     return {plugin.__name__: plugin(self) for plugin in plugins}
 
 
@@ -98,6 +117,64 @@ class TempPathLoader(znflow.utils.IterableHandler):
             return tmp_path.as_posix()
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_file(content: str, suffix: str) -> t.Any:
+    if suffix == ".json":
+        return json.loads(content)
+    return yaml.safe_load(content)
+
+
+def clear_caches() -> None:
+    """Clear the cached file systems, stage lookups and parsed pipeline files.
+
+    'Project.build' and 'Project.finalize' call this after writing
+    the pipeline files. Call it after changing them by other means,
+    e.g. a 'git checkout' within the same process.
+    """
+    from zntrack.from_rev import _get_stage_cmds
+    from zntrack.state import _get_dvc_fs
+
+    _get_stage_cmds.cache_clear()
+    _get_dvc_fs.cache_clear()
+    _parse_file.cache_clear()
+
+
+def load_file_cached(fs: AbstractFileSystem, path: str | pathlib.Path) -> t.Any:
+    """Load a JSON or YAML file, reusing the parsed content for local files.
+
+    Local files are read on every call, but only parsed again if their
+    content changed. The returned object is shared, do not modify it in place.
+    """
+    suffix = pathlib.Path(path).suffix
+    if isinstance(fs, LocalFileSystem):
+        return _parse_file(pathlib.Path(path).read_text(), suffix)
+    with fs.open(path) as f:
+        if suffix == ".json":
+            return json.load(f)
+        return yaml.safe_load(f)
+
+
+def write_text_if_changed(path: pathlib.Path, content: str) -> bool:
+    """Write 'content' to 'path' only if it differs from the file on disk.
+
+    Keeping unchanged files untouched preserves their modification time.
+    Returns True if the file was written.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        if path.read_text() == content:
+            return False
+    path.write_text(content)
+    return True
+
+
+def is_commit_sha(rev: str | None) -> bool:
+    """Whether 'rev' is a full git commit SHA.
+
+    Only those are immutable, branches, tags or e.g. 'HEAD' can move.
+    """
+    return rev is not None and re.fullmatch(r"[0-9a-fA-F]{40}", rev) is not None
+
+
 def sort_key(item):
     """Custom sorting key function to handle both string and dictionary types."""
     if isinstance(item, str):
@@ -109,29 +186,15 @@ def sort_key(item):
 
 def sort_and_deduplicate(data: list[str | dict[str, dict]]):
     """Sort and deduplicate a list of strings and dictionaries."""
-    data = sorted(data, key=sort_key)
-
-    new_data = []
-    for key in data:
-        if key not in new_data:
-            if isinstance(key, dict):
-                if next(iter(key.keys())) in new_data:
-                    raise ValueError(
-                        f"Duplicate key with different parameters found: {key}"
-                    )
-                for other_key in new_data:
-                    if isinstance(other_key, dict):
-                        if next(iter(other_key.keys())) == next(iter(key.keys())):
-                            if other_key != key:
-                                raise ValueError(
-                                    f"Duplicate key with different parameters found: {key}"
-                                )
-            if isinstance(key, str):
-                for other_key in new_data:
-                    if isinstance(other_key, dict) and key in other_key.keys():
-                        raise ValueError(
-                            f"Duplicate key with different parameters found: {key}"
-                        )
-            new_data.append(key)
-
-    return new_data
+    seen = {}
+    for item in sorted(data, key=sort_key):
+        # entries are identified by their path, the same path
+        # with different parameters is not allowed.
+        path = sort_key(item)
+        if path in seen:
+            if seen[path] != item:
+                raise ValueError(f"Duplicate key with different parameters found: {item}")
+        else:
+            seen[path] = item
+
+    return list(seen.values())
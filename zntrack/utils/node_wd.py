@@ -12,6 +12,7 @@ import znjson
 
 from zntrack.add import DVCImportPath
 from zntrack.config import NWD_PATH, ZNTRACK_FILE_PATH, NodeStatusEnum
+from zntrack.utils.misc import load_file_cached
 
 if t.TYPE_CHECKING:
     from zntrack import Node
@@ -50,35 +51,48 @@ def get_nwd(node: "Node") -> pathlib.Path:
         The node instance for which the nwd should be returned.
 
     """
+    # 'node.state' creates a new NodeStatus on every access
+    state = node.state
     try:
         nwd = node.__dict__["nwd"]
     except KeyError:
         if node.name is None:
             raise ValueError("Unable to determine node name.")
         if (
-            node.state.remote is None
-            and node.state.rev is None
-            and node.state.state == NodeStatusEnum.FINISHED
+            state.remote is None
+            and state.rev is None
+            and state.state == NodeStatusEnum.FINISHED
         ):
             nwd = pathlib.Path(NWD_PATH, node.name)
         else:
             try:
-                with node.state.fs.open(ZNTRACK_FILE_PATH) as f:
-                    zntrack_config = json.load(f)
+                zntrack_config = load_file_cached(state.fs, ZNTRACK_FILE_PATH)
                 nwd = zntrack_config[node.name]["nwd"]
                 nwd = json.loads(json.dumps(nwd), cls=znjson.ZnDecoder)
             except (FileNotFoundError, KeyError):
                 nwd = pathlib.Path(NWD_PATH, node.name)
 
-    if node.state.group is not None:
+    if state.group is not None:
         # strip the groups from node_name
-        to_replace = "_".join(node.state.group.name) + "_"
-        replacement = "/".join(node.state.group.name) + "/"
+        to_replace = "_".join(state.group.name) + "_"
+        replacement = "/".join(state.group.name) + "/"
         nwd = pathlib.Path(str(nwd).replace(to_replace, replacement))
 
     return nwd
 
 
+def make_nwd(node: "Node") -> pathlib.Path:
+    """Return the node working directory and create it if it does not exist.
+
+    The nwd is only resolved once and the 'mkdir' call is skipped
+    for existing directories.
+    """
+    node_wd = node.nwd
+    if not node_wd.is_dir():
+        node_wd.mkdir(parents=True, exist_ok=True)
+    return node_wd
+
+
 class NWDReplaceHandler(znflow.utils.IterableHandler):
     """Replace the nwd placeholder with the actual nwd."""
 